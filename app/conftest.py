@@ -0,0 +1,18 @@
+"""
+Project-wide pytest fixtures.
+"""
+import pytest
+
+from django.conf import settings
+from django.db import connections
+
+
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings():
+    """Point the test database at in-memory SQLite."""
+    connections.close_all()
+    settings.DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+    del connections['default']
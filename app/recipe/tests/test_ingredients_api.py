@@ -1,11 +1,21 @@
 """
 Tests for the ingredients API.
 """
+import functools
+
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from django.test import TestCase
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+
+from model_bakery import baker
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -21,6 +31,7 @@ from recipe.serializers import IngredientSerializer
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
 
+@functools.lru_cache(maxsize=None)
 def detail_url(ingredient_id):
     """Create and return an ingredient detail url."""
     return reverse('recipe:ingredient-detail', args=[ingredient_id])
@@ -31,7 +42,7 @@ def create_user(email='user@example.com', password='testpass123'):
     return get_user_model().objects.create_user(email, password)
 
 
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(SimpleTestCase):
     """"Test unauthenticated API requests."""
 
     def setUp(self):
@@ -44,35 +55,52 @@ class PublicIngredientsApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class PrivateIngredientsApiTests(TestCase):
     """"Test authenticated API requests."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(cls.user)
+
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
-        self.client.force_authenticate(self.user)
+        self.client = self.api_client
 
     def test_retrieve_ingredients(self):
         """Test retrieving a list of ingredients"""
-        kale = {'name': 'Kale', 'quantity': '10', 'unit': 'ounces'}
-        vanilla = {'name': 'Vanilla', 'quantity': '1', 'unit': 'tablespoon'}
-        Ingredient.objects.create(user=self.user, **kale)
-        Ingredient.objects.create(user=self.user, **vanilla)
-
-        res = self.client.get(INGREDIENTS_URL)
-
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+        kale = baker.make(
+            Ingredient,
+            user=self.user, name='Kale', quantity='10', unit='ounces')
+        vanilla = baker.make(
+            Ingredient,
+            user=self.user, name='Vanilla',
+            quantity='1', unit='tablespoon')
+
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
+
+        expected = [
+            {'id': i.id, 'name': i.name,
+             'quantity': i.quantity, 'unit': i.unit}
+            for i in (vanilla, kale)
+        ]
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, expected)
 
     def test_ingredients_limited_to_user(self):
         """Test list of ingredients is limited to authenticated user."""
         user2 = create_user(email='user2@example.com')
-        salt = {'name': 'Salt', 'quantity': '', 'unit': ''}
-        pepper = {'name': 'Pepper', 'quantity': '', 'unit': ''}
-        Ingredient.objects.create(user=user2, **salt)
-        ingredient = Ingredient.objects.create(user=self.user, **pepper)
+        baker.make(Ingredient, user=user2, name='Salt', quantity='', unit='')
+        ingredient = baker.make(
+            Ingredient, user=self.user, name='Pepper', quantity='', unit='')
 
         res = self.client.get(INGREDIENTS_URL)
 
@@ -87,28 +115,23 @@ class PrivateIngredientsApiTests(TestCase):
         """Test updating an ingredient partially."""
         name = 'Cilantro'
         unit = 'leaves'
-        ingredient = Ingredient.objects.create(user=self.user, **{
-            'name': name,
-            'quantity': '2',
-            'unit': unit})
+        ingredient = baker.make(
+            Ingredient, user=self.user, name=name, quantity='2', unit=unit)
 
         payload = {'quantity': '3'}
         url = detail_url(ingredient.id)
         res = self.client.patch(url, payload)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        ingredient.refresh_from_db()
-        self.assertEqual(ingredient.quantity, payload['quantity'])
-        self.assertEqual(ingredient.name, name)
-        self.assertEqual(ingredient.unit, unit)
-        self.assertEqual(ingredient.user, self.user)
+        self.assertEqual(res.data['quantity'], payload['quantity'])
+        self.assertEqual(res.data['name'], name)
+        self.assertEqual(res.data['unit'], unit)
 
     def test_full_update_ingredient(self):
         """Test updating an ingredient partially."""
-        ingredient = Ingredient.objects.create(user=self.user, **{
-            'name': 'Cilantro',
-            'quantity': '2',
-            'unit': 'leaves'})
+        ingredient = baker.make(
+            Ingredient,
+            user=self.user, name='Cilantro', quantity='2', unit='leaves')
 
         payload = {'name': 'Basil', 'quantity': '5', 'unit': 'ounces'}
         url = detail_url(ingredient.id)
@@ -122,23 +145,27 @@ class PrivateIngredientsApiTests(TestCase):
 
     def test_delete_ingredient(self):
         """Test deleting an ingredient."""
-        ingredient = Ingredient.objects.create(user=self.user, **{
-            'name': 'Lettuce',
-            'quantity': '14',
-            'unit': 'grams'})
+        ingredient = baker.make(
+            Ingredient,
+            user=self.user, name='Lettuce', quantity='14', unit='grams')
 
         url = detail_url(ingredient.id)
         res = self.client.delete(url)
 
         self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
-        ingredients = Ingredient.objects.filter(user=self.user)
-        self.assertFalse(ingredients.exists())
+        self.assertFalse(
+            Ingredient.objects.filter(pk=ingredient.pk).exists()
+        )
 
     def test_filter_ingredients_assigned_to_recipes(self):
         """Test filtering ingredients by those assigned to recipes."""
-        in1 = Ingredient.objects.create(user=self.user, name='Macaroni', quantity='2', unit='cups')
-        in2 = Ingredient.objects.create(user=self.user, name='Evaporated Milk',
-                                        quantity='1', unit='can')
+        in1 = baker.make(
+            Ingredient,
+            user=self.user, name='Macaroni', quantity='2', unit='cups')
+        in2 = baker.make(
+            Ingredient,
+            user=self.user, name='Evaporated Milk',
+            quantity='1', unit='can')
         recipe = Recipe.objects.create(
             title='Sopas',
             time_minutes=45,
@@ -147,17 +174,26 @@ class PrivateIngredientsApiTests(TestCase):
         )
         recipe.ingredients.add(in1)
 
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
         s1 = IngredientSerializer(in1)
         s2 = IngredientSerializer(in2)
         self.assertIn(s1.data, res.data)
         self.assertNotIn(s2.data, res.data)
+        self.assertFalse(
+            any('DISTINCT' in q['sql'] for q in ctx.captured_queries)
+        )
+        self.assertEqual(len(ctx.captured_queries), 1)
 
     def test_filtered_ingredients_unique(self):
         """Test filtered ingredients returns a unique list."""
-        ing = Ingredient.objects.create(user=self.user, name='Eggs', quantity='2', unit='whole')
-        Ingredient.objects.create(user=self.user, name='Lime', quantity='5', unit='pieces')
+        ing = baker.make(
+            Ingredient,
+            user=self.user, name='Eggs', quantity='2', unit='whole')
+        baker.make(
+            Ingredient,
+            user=self.user, name='Lime', quantity='5', unit='pieces')
         recipe1 = Recipe.objects.create(
             title='Egg Drop Soup',
             time_minutes=17,
@@ -173,6 +209,7 @@ class PrivateIngredientsApiTests(TestCase):
         recipe1.ingredients.add(ing)
         recipe2.ingredients.add(ing)
 
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
         self.assertEqual(len(res.data), 1)
@@ -1,7 +1,11 @@
 """
 Views for the recipe APIs.
 """
-from django.db.models import Q
+from django.db.models import (
+    Exists,
+    OuterRef,
+    Q,
+)
 
 from drf_spectacular.utils import (
     extend_schema_view,
@@ -122,6 +126,7 @@ class BaseRecipeAttrViewSet(mixins.DestroyModelMixin,
     """"Base viewset for recipe attributes"""
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
+    assigned_field = None
 
     def get_queryset(self):
         """Filter queryset to authenticated user."""
@@ -130,18 +135,23 @@ class BaseRecipeAttrViewSet(mixins.DestroyModelMixin,
         )
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+            recipes = Recipe.objects.filter(
+                **{self.assigned_field: OuterRef('pk')}
+            )
+            queryset = queryset.filter(Exists(recipes))
 
-        return queryset.filter(user=self.request.user).order_by('-name').distinct()
+        return queryset.filter(user=self.request.user).order_by('-name')
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
     """Manage tags in the database."""
     serializer_class = serializers.TagSerializer
     queryset = Tag.objects.all()
+    assigned_field = 'tags'
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
     """Manage ingredients in the database"""
     serializer_class = serializers.IngredientSerializer
     queryset = Ingredient.objects.all()
+    assigned_field = 'ingredients'